@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import platform
 import signal
 import ssl
 from functools import partial
-from multiprocessing.synchronize import Event as EventType
 from os import getpid
-from socket import socket
+from socket import socket, socketpair
+from types import ModuleType
 from typing import Any, Awaitable, Callable, Optional
 from weakref import WeakSet
 
@@ -19,20 +18,70 @@ from .worker_context import WorkerContext
 from ..config import Config, Sockets
 from ..typing import AppWrapper
 from ..utils import (
-    check_multiprocess_shutdown_event,
+    IS_WINDOWS,
     load_application,
     raise_shutdown,
     repr_socket_addr,
+    SHUTDOWN_SIGNALS,
     ShutdownError,
 )
 
+uvloop: Optional[ModuleType]
+try:
+    import uvloop as _uvloop
+except ImportError:
+    uvloop = None
+else:
+    uvloop = _uvloop
+
 
 async def _windows_signal_support() -> None:
     # See https://bugs.python.org/issue23057, to catch signals on
-    # Windows it is necessary for an IO event to happen periodically.
-    # Fixed by Python 3.8
-    while True:
-        await asyncio.sleep(1)
+    # Windows it is necessary for an IO event to happen. Setting a
+    # wakeup fd ensures the signal itself is an IO event that wakes
+    # the loop, rather than waking the loop periodically.
+    loop = asyncio.get_running_loop()
+    read_sock, write_sock = socketpair()
+    read_sock.setblocking(False)
+    write_sock.setblocking(False)
+    try:
+        previous_fd = signal.set_wakeup_fd(write_sock.fileno())
+    except ValueError:
+        # Not the main thread, which is the only thread to receive
+        # signals.
+        read_sock.close()
+        write_sock.close()
+        return
+
+    try:
+        while True:
+            await loop.sock_recv(read_sock, 4096)
+    finally:
+        signal.set_wakeup_fd(previous_fd)
+        read_sock.close()
+        write_sock.close()
+
+
+async def _wait_readable(sock: socket) -> None:
+    loop = asyncio.get_running_loop()
+    readable = loop.create_future()
+    try:
+        loop.add_reader(sock.fileno(), _set_readable, readable)
+    except NotImplementedError:
+        # The proactor loop (Windows) does not support add_reader. It
+        # is only used with a single worker, so consuming is fine.
+        await loop.sock_recv(sock, 1)
+        return
+
+    try:
+        await readable
+    finally:
+        loop.remove_reader(sock.fileno())
+
+
+def _set_readable(readable: asyncio.Future) -> None:
+    if not readable.done():
+        readable.set_result(None)
 
 
 def _share_socket(sock: socket) -> socket:
@@ -50,170 +99,199 @@ async def worker_serve(
     *,
     sockets: Optional[Sockets] = None,
     shutdown_trigger: Optional[Callable[..., Awaitable[None]]] = None,
+    ssl_context: Optional[ssl.SSLContext] = None,
 ) -> None:
     config.set_statsd_logger_class(StatsdLogger)
 
     loop = asyncio.get_event_loop()
 
+    loop_signals = []
     if shutdown_trigger is None:
         signal_event = asyncio.Event()
 
         def _signal_handler(*_: Any) -> None:  # noqa: N803
             signal_event.set()
 
-        for signal_name in {"SIGINT", "SIGTERM", "SIGBREAK"}:
-            if hasattr(signal, signal_name):
-                try:
-                    loop.add_signal_handler(getattr(signal, signal_name), _signal_handler)
-                except NotImplementedError:
-                    # Add signal handler may not be implemented on Windows
-                    signal.signal(getattr(signal, signal_name), _signal_handler)
+        for signal_ in SHUTDOWN_SIGNALS:
+            try:
+                loop.add_signal_handler(signal_, _signal_handler)
+            except NotImplementedError:
+                # Add signal handler may not be implemented on Windows
+                signal.signal(signal_, _signal_handler)
+            else:
+                loop_signals.append(signal_)
 
         shutdown_trigger = signal_event.wait  # type: ignore
 
-    lifespan = Lifespan(app, config, loop)
-
-    lifespan_task = loop.create_task(lifespan.handle_lifespan())
-    await lifespan.wait_for_startup()
-    if lifespan_task.done():
-        exception = lifespan_task.exception()
-        if exception is not None:
-            raise exception
-
-    if sockets is None:
-        sockets = config.create_sockets()
-
-    ssl_handshake_timeout = None
-    if config.ssl_enabled:
-        ssl_context = config.create_ssl_context()
-        ssl_handshake_timeout = config.ssl_handshake_timeout
-
-    context = WorkerContext()
-    server_tasks: WeakSet = WeakSet()
-
-    async def _server_callback(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
-        server_tasks.add(asyncio.current_task(loop))
-        await TCPServer(app, loop, config, context, reader, writer)
-
-    servers = []
-    for sock in sockets.secure_sockets:
-        if config.workers > 1 and platform.system() == "Windows":
-            sock = _share_socket(sock)
-
-        servers.append(
-            await asyncio.start_server(
-                _server_callback,
-                backlog=config.backlog,
-                ssl=ssl_context,
-                sock=sock,
-                ssl_handshake_timeout=ssl_handshake_timeout,
+    try:
+        lifespan = Lifespan(app, config, loop)
+
+        lifespan_task = loop.create_task(lifespan.handle_lifespan())
+        await lifespan.wait_for_startup()
+        if lifespan_task.done():
+            exception = lifespan_task.exception()
+            if exception is not None:
+                raise exception
+
+        if sockets is None:
+            sockets = config.create_sockets()
+
+        ssl_handshake_timeout = None
+        if config.ssl_enabled:
+            if ssl_context is None:
+                ssl_context = config.create_ssl_context()
+            ssl_handshake_timeout = config.ssl_handshake_timeout
+
+        context = WorkerContext()
+        server_tasks: WeakSet = WeakSet()
+
+        async def _server_callback(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            server_tasks.add(asyncio.current_task(loop))
+            await TCPServer(app, loop, config, context, reader, writer)
+
+        share_sockets = config.workers > 1 and IS_WINDOWS
+        servers = []
+        for sock in sockets.secure_sockets:
+            if share_sockets:
+                sock = _share_socket(sock)
+
+            servers.append(
+                await asyncio.start_server(
+                    _server_callback,
+                    backlog=config.backlog,
+                    ssl=ssl_context,
+                    sock=sock,
+                    ssl_handshake_timeout=ssl_handshake_timeout,
+                )
             )
-        )
-        bind = repr_socket_addr(sock.family, sock.getsockname())
-        await config.log.info(f"Running on https://{bind} (CTRL + C to quit)")
-
-    for sock in sockets.insecure_sockets:
-        if config.workers > 1 and platform.system() == "Windows":
-            sock = _share_socket(sock)
-
-        servers.append(
-            await asyncio.start_server(_server_callback, backlog=config.backlog, sock=sock)
-        )
-        bind = repr_socket_addr(sock.family, sock.getsockname())
-        await config.log.info(f"Running on http://{bind} (CTRL + C to quit)")
-
-    for sock in sockets.quic_sockets:
-        if config.workers > 1 and platform.system() == "Windows":
-            sock = _share_socket(sock)
+            bind = repr_socket_addr(sock.family, sock.getsockname())
+            await config.log.info(f"Running on https://{bind} (CTRL + C to quit)")
 
-        _, protocol = await loop.create_datagram_endpoint(
-            lambda: UDPServer(app, loop, config, context), sock=sock
-        )
-        server_tasks.add(loop.create_task(protocol.run()))
-        bind = repr_socket_addr(sock.family, sock.getsockname())
-        await config.log.info(f"Running on https://{bind} (QUIC) (CTRL + C to quit)")
+        for sock in sockets.insecure_sockets:
+            if share_sockets:
+                sock = _share_socket(sock)
 
-    tasks = []
-    if platform.system() == "Windows":
-        tasks.append(loop.create_task(_windows_signal_support()))
+            servers.append(
+                await asyncio.start_server(_server_callback, backlog=config.backlog, sock=sock)
+            )
+            bind = repr_socket_addr(sock.family, sock.getsockname())
+            await config.log.info(f"Running on http://{bind} (CTRL + C to quit)")
 
-    tasks.append(loop.create_task(raise_shutdown(shutdown_trigger)))
+        for sock in sockets.quic_sockets:
+            if share_sockets:
+                sock = _share_socket(sock)
 
-    try:
-        if len(tasks):
-            gathered_tasks = asyncio.gather(*tasks)
-            await gathered_tasks
-        else:
-            loop.run_forever()
-    except (ShutdownError, KeyboardInterrupt):
-        pass
-    finally:
-        await context.terminated.set()
+            _, protocol = await loop.create_datagram_endpoint(
+                partial(UDPServer, app, loop, config, context), sock=sock
+            )
+            server_tasks.add(loop.create_task(protocol.run()))
+            bind = repr_socket_addr(sock.family, sock.getsockname())
+            await config.log.info(f"Running on https://{bind} (QUIC) (CTRL + C to quit)")
 
-        for server in servers:
-            server.close()
-            await server.wait_closed()
+        tasks = []
+        if IS_WINDOWS:
+            tasks.append(loop.create_task(_windows_signal_support()))
 
-        # Retrieve the Gathered Tasks Cancelled Exception, to
-        # prevent a warning that this hasn't been done.
-        gathered_tasks.exception()
+        tasks.append(loop.create_task(raise_shutdown(shutdown_trigger)))
 
         try:
-            gathered_server_tasks = asyncio.gather(*server_tasks)
-            await asyncio.wait_for(gathered_server_tasks, config.graceful_timeout)
-        except asyncio.TimeoutError:
+            if len(tasks):
+                gathered_tasks = asyncio.gather(*tasks)
+                await gathered_tasks
+            else:
+                loop.run_forever()
+        except (ShutdownError, KeyboardInterrupt):
             pass
         finally:
+            await context.terminated.set()
+
+            for server in servers:
+                server.close()
+                await server.wait_closed()
+
             # Retrieve the Gathered Tasks Cancelled Exception, to
             # prevent a warning that this hasn't been done.
-            gathered_server_tasks.exception()
+            gathered_tasks.exception()
 
-            await lifespan.wait_for_shutdown()
-            lifespan_task.cancel()
-            await lifespan_task
+            try:
+                gathered_server_tasks = asyncio.gather(*server_tasks)
+                await asyncio.wait_for(gathered_server_tasks, config.graceful_timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                # Retrieve the Gathered Tasks Cancelled Exception, to
+                # prevent a warning that this hasn't been done.
+                gathered_server_tasks.exception()
+
+                await lifespan.wait_for_shutdown()
+                lifespan_task.cancel()
+                await lifespan_task
+    finally:
+        # Restore the signal handling so that it doesn't refer to this
+        # (now finished) serving, however it finished.
+        for signal_ in loop_signals:
+            loop.remove_signal_handler(signal_)
 
 
 def asyncio_worker(
-    config: Config, sockets: Optional[Sockets] = None, shutdown_event: Optional[EventType] = None
+    config: Config,
+    sockets: Optional[Sockets] = None,
+    shutdown_sock: Optional[socket] = None,
+    app: Optional[AppWrapper] = None,
+    ssl_context: Optional[ssl.SSLContext] = None,
 ) -> None:
-    app = load_application(config.application_path, config.wsgi_max_body_size)
+    if app is None:
+        app = load_application(config.application_path, config.wsgi_max_body_size)
 
     shutdown_trigger = None
-    if shutdown_event is not None:
-        shutdown_trigger = partial(check_multiprocess_shutdown_event, shutdown_event, asyncio.sleep)
+    if shutdown_sock is not None:
+        shutdown_trigger = partial(_wait_readable, shutdown_sock)
 
-    if config.workers > 1 and platform.system() == "Windows":
+    if config.workers > 1 and IS_WINDOWS:
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore
+    elif config.prefer_uvloop and uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     _run(
-        partial(worker_serve, app, config, sockets=sockets),
+        partial(worker_serve, app, config, sockets=sockets, ssl_context=ssl_context),
         debug=config.debug,
         shutdown_trigger=shutdown_trigger,
     )
 
+    if shutdown_sock is not None:
+        shutdown_sock.close()
+
 
 def uvloop_worker(
-    config: Config, sockets: Optional[Sockets] = None, shutdown_event: Optional[EventType] = None
+    config: Config,
+    sockets: Optional[Sockets] = None,
+    shutdown_sock: Optional[socket] = None,
+    app: Optional[AppWrapper] = None,
+    ssl_context: Optional[ssl.SSLContext] = None,
 ) -> None:
-    try:
-        import uvloop
-    except ImportError as error:
-        raise Exception("uvloop is not installed") from error
-    else:
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    if uvloop is None:
+        raise Exception("uvloop is not installed")
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-    app = load_application(config.application_path, config.wsgi_max_body_size)
+    if app is None:
+        app = load_application(config.application_path, config.wsgi_max_body_size)
 
     shutdown_trigger = None
-    if shutdown_event is not None:
-        shutdown_trigger = partial(check_multiprocess_shutdown_event, shutdown_event, asyncio.sleep)
+    if shutdown_sock is not None:
+        shutdown_trigger = partial(_wait_readable, shutdown_sock)
 
     _run(
-        partial(worker_serve, app, config, sockets=sockets),
+        partial(worker_serve, app, config, sockets=sockets, ssl_context=ssl_context),
         debug=config.debug,
         shutdown_trigger=shutdown_trigger,
     )
 
+    if shutdown_sock is not None:
+        shutdown_sock.close()
+
 
 def _run(
     main: Callable,
@@ -223,6 +301,9 @@ def _run(
 ) -> None:
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    # Set explicitly, rather than only when True, so that asyncio's
+    # debug mode is not enabled via the PYTHONASYNCIODEBUG environment
+    # variable or development mode unless configured.
     loop.set_debug(debug)
     loop.set_exception_handler(_exception_handler)
 
@@ -246,7 +327,8 @@ def _run(
 
 
 def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
-    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    # all_tasks only returns tasks that are not done.
+    tasks = asyncio.all_tasks(loop)
     if not tasks:
         return
 
@@ -255,11 +337,15 @@ def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
     loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
 
     for task in tasks:
-        if not task.cancelled() and task.exception() is not None:
+        if task.cancelled():
+            continue
+
+        exception = task.exception()
+        if exception is not None:
             loop.call_exception_handler(
                 {
                     "message": "unhandled exception during shutdown",
-                    "exception": task.exception(),
+                    "exception": exception,
                     "task": task,
                 }
             )
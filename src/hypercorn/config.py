@@ -30,6 +30,9 @@ BYTES = 1
 OCTETS = 1
 SECONDS = 1.0
 
+KEEPALIVE_OPTIONS = [("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)]
+NOTSENT_LOWAT = 16 * 1024 * BYTES
+
 FilePath = Union[AnyStr, os.PathLike]
 SocketKind = Union[int, socket.SocketKind]
 
@@ -49,6 +52,24 @@ class SocketTypeError(Exception):
         )
 
 
+def _set_keepalive(sock: socket.socket) -> None:
+    # Accepted sockets inherit these options, which ensure that dead
+    # (half-open) connections are noticed and closed.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in KEEPALIVE_OPTIONS:
+        if hasattr(socket, name):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+
+
+def _set_notsent_lowat(sock: socket.socket) -> None:
+    # Accepted sockets inherit this option, which limits the unsent
+    # data the kernel buffers per connection. Writers then wait for
+    # the connection to drain rather than filling a large send buffer,
+    # reducing the memory used and the latency of later writes.
+    if hasattr(socket, "TCP_NOTSENT_LOWAT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT, NOTSENT_LOWAT)
+
+
 class Config:
     _bind = ["127.0.0.1:8000"]
     _insecure_bind: List[str] = []
@@ -87,6 +108,8 @@ class Config:
     loglevel: str = "INFO"
     max_app_queue_size: int = 10
     pid_path: Optional[str] = None
+    prefer_uvloop = True
+    preload_app = False
     server_names: List[str] = []
     shutdown_timeout = 60 * SECONDS
     ssl_handshake_timeout = 60 * SECONDS
@@ -243,6 +266,9 @@ class Config:
                         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
                     except AttributeError:
                         pass
+                if type_ == socket.SOCK_STREAM:
+                    _set_keepalive(sock)
+                    _set_notsent_lowat(sock)
                 binding = (host, port)
 
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -42,6 +42,7 @@ class ProtocolWrapper:
                 self.server,
                 self.send,
             )
+            self._bypass_upgrades()
         else:
             self.protocol = H11Protocol(
                 self.app,
@@ -72,6 +73,7 @@ class ProtocolWrapper:
                 self.send,
             )
             await self.protocol.initiate()
+            self._bypass_upgrades()
             if error.data != b"":
                 return await self.protocol.handle(RawData(data=error.data))
         except H2CProtocolRequiredError as error:
@@ -86,5 +88,12 @@ class ProtocolWrapper:
                 self.send,
             )
             await self.protocol.initiate(error.headers, error.settings)
+            self._bypass_upgrades()
             if error.data != b"":
                 return await self.protocol.handle(RawData(data=error.data))
+
+    def _bypass_upgrades(self) -> None:
+        # Only the H11Protocol raises upgrade errors, hence once the
+        # connection is HTTP/2 events can be handled directly without
+        # this wrapper.
+        self.handle = self.protocol.handle  # type: ignore
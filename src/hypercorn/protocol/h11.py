@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from itertools import chain
-from typing import Awaitable, Callable, cast, Optional, Tuple, Type, Union
+from typing import Awaitable, Callable, cast, List, Optional, Tuple, Type, Union
 
 import h11
 
@@ -56,16 +56,21 @@ class H11WSConnection:
     trailing_data = (b"", False)
 
     def __init__(self, h11_connection: h11.Connection) -> None:
-        self.buffer = bytearray(h11_connection.trailing_data[0])
+        # The received data is kept as a list of chunks, rather than
+        # copied into a bytearray, as joining a single chunk returns it
+        # without a copy.
+        self.buffer: List[bytes] = []
         self.h11_connection = h11_connection
+        self.receive_data(h11_connection.trailing_data[0])
 
     def receive_data(self, data: bytes) -> None:
-        self.buffer.extend(data)
+        if data:
+            self.buffer.append(data)
 
     def next_event(self) -> Union[Data, Type[h11.NEED_DATA]]:
         if self.buffer:
-            event = Data(stream_id=STREAM_ID, data=bytes(self.buffer))
-            self.buffer = bytearray()
+            event = Data(stream_id=STREAM_ID, data=b"".join(self.buffer))
+            self.buffer = []
             return event
         else:
             return h11.NEED_DATA
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-import platform
 import signal
+import socket
 import time
 from multiprocessing import get_context
 from multiprocessing.context import BaseContext
 from multiprocessing.process import BaseProcess
-from multiprocessing.synchronize import Event as EventType
 from pickle import PicklingError
-from typing import Any, List
+from ssl import SSLContext
+from typing import Any, List, Optional
 
 from .config import Config, Sockets
-from .typing import WorkerFunc
-from .utils import load_application, wait_for_changes, write_pid_file
+from .typing import AppWrapper, WorkerFunc
+from .utils import (
+    IS_LINUX,
+    IS_WINDOWS,
+    load_application,
+    reload_application,
+    SHUTDOWN_SIGNALS,
+    wait_for_changes,
+    write_pid_file,
+)
 
 
 def run(config: Config) -> None:
@@ -25,7 +33,11 @@ def run(config: Config) -> None:
 
         worker_func = asyncio_worker
     elif config.worker_class == "uvloop":
-        from .asyncio.run import uvloop_worker
+        from .asyncio.run import uvloop, uvloop_worker
+
+        # Fail once here, rather than in every worker after starting.
+        if uvloop is None:
+            raise Exception("uvloop is not installed")
 
         worker_func = uvloop_worker
     elif config.worker_class == "trio":
@@ -35,62 +47,152 @@ def run(config: Config) -> None:
     else:
         raise ValueError(f"No worker of class {config.worker_class} exists")
 
-    sockets = config.create_sockets()
+    # Bind in the parent so that any errors, such as the address being
+    # in use, are raised here rather than separately in each worker.
+    sockets: Optional[Sockets] = config.create_sockets()
+    if _bind_per_worker(config):
+        # SO_REUSEPORT is set, so each worker can then bind its own
+        # socket to the same address. None indicates this.
+        for sock in sockets.secure_sockets + sockets.insecure_sockets + sockets.quic_sockets:
+            sock.close()
+        sockets = None
 
     # Load the application so that the correct paths are checked for
-    # changes.
-    load_application(config.application_path, config.wsgi_max_body_size)
-
-    ctx = get_context("spawn")
-
+    # changes, and so that forked workers can share it if preloading.
+    app = load_application(config.application_path, config.wsgi_max_body_size)
+
+    # If preloading, forked workers inherit the parent's imported
+    # modules, loaded app and SSL context, rather than creating them
+    # again. This is only possible whilst the parent's modules are up
+    # to date, after that the workers must be spawned to import the
+    # changed code. Otherwise workers are spawned so that each imports
+    # the app itself, sharing nothing created at import time.
+    can_fork = IS_LINUX and config.preload_app
+    ssl_context = config.create_ssl_context() if can_fork else None
+
+    # The parent waits for shutdown on its own pair, as a worker may
+    # consume the byte written to the workers' pair (see
+    # asyncio.run._wait_readable).
+    wakeup_sock, wakeup_writer = socket.socketpair()
+
+    shutdown_pair: List[socket.socket] = []
     active = True
     while active:
+        worker_app: Optional[AppWrapper] = None
+        worker_ssl_context: Optional[SSLContext] = None
+        if can_fork:
+            ctx = get_context("fork")
+            worker_app = app
+            worker_ssl_context = ssl_context
+        else:
+            ctx = get_context("spawn")
+
         # Ignore SIGINT before creating the processes, so that they
         # inherit the signal handling. This means that the shutdown
-        # function controls the shutdown.
+        # function controls the shutdown. The other signals are reset
+        # so that forked workers do not inherit the shutdown function
+        # installed by the previous iteration.
         signal.signal(signal.SIGINT, signal.SIG_IGN)
-
-        shutdown_event = ctx.Event()
-        processes = start_processes(config, worker_func, sockets, shutdown_event, ctx)
+        for signal_ in SHUTDOWN_SIGNALS:
+            if signal_ != signal.SIGINT:
+                signal.signal(signal_, signal.SIG_DFL)
+
+        # The previous workers have been told to shutdown, so their
+        # pair can be closed. This is done after resetting the signals
+        # above, as the shutdown function writes to this pair.
+        for sock in shutdown_pair:
+            sock.close()
+
+        # The workers shutdown when the shutdown socket becomes
+        # readable, i.e. when a byte is written to the pair.
+        shutdown_sock, shutdown_writer = socket.socketpair()
+        shutdown_pair = [shutdown_sock, shutdown_writer]
+        processes = start_processes(
+            config, worker_func, sockets, shutdown_sock, worker_app, worker_ssl_context, ctx
+        )
 
         def shutdown(*args: Any) -> None:
-            nonlocal active, shutdown_event
-            shutdown_event.set()
+            nonlocal active
+            shutdown_writer.send(b"\0")
+            wakeup_writer.send(b"\0")
             active = False
 
-        for signal_name in {"SIGINT", "SIGTERM", "SIGBREAK"}:
-            if hasattr(signal, signal_name):
-                signal.signal(getattr(signal, signal_name), shutdown)
+        for signal_ in SHUTDOWN_SIGNALS:
+            signal.signal(signal_, shutdown)
 
         if config.use_reloader:
-            wait_for_changes(shutdown_event)
-            shutdown_event.set()
+            changed_paths = wait_for_changes(wakeup_sock)
+            shutdown_writer.send(b"\0")
+            if active and can_fork:
+                try:
+                    reloaded_app = reload_application(
+                        config.application_path, config.wsgi_max_body_size, changed_paths
+                    )
+                except Exception:
+                    # Leave the spawned workers to report the error
+                    reloaded_app = None
+
+                if reloaded_app is None:
+                    can_fork = False
+                else:
+                    app = reloaded_app
         else:
             active = False
 
+    # The workers are all told to shutdown at once via the shutdown
+    # socket, so they exit concurrently and joining them in turn only
+    # waits for the slowest. Each has exited once joined, hence there
+    # is nothing left to terminate.
     for process in processes:
         process.join()
-    for process in processes:
-        process.terminate()
 
-    for sock in sockets.secure_sockets:
-        sock.close()
-    for sock in sockets.insecure_sockets:
-        sock.close()
+    shutdown_sock.close()
+    shutdown_writer.close()
+    wakeup_sock.close()
+    wakeup_writer.close()
+
+    if sockets is not None:
+        for sock in sockets.secure_sockets:
+            sock.close()
+        for sock in sockets.insecure_sockets:
+            sock.close()
+
+
+def _bind_per_worker(config: Config) -> bool:
+    # Linux balances incoming connections across sockets bound to the
+    # same address with SO_REUSEPORT, which spreads the load more
+    # evenly than having every worker accept on a single shared
+    # socket. Unix and fd binds cannot be bound more than once, and
+    # port 0 binds would give each worker a different port.
+    binds = config.bind + config.insecure_bind + config.quic_bind
+    return (
+        config.workers > 1
+        and IS_LINUX
+        and hasattr(socket, "SO_REUSEPORT")
+        and not any(bind.startswith(("unix:", "fd://")) or bind.endswith(":0") for bind in binds)
+    )
 
 
 def start_processes(
     config: Config,
     worker_func: WorkerFunc,
-    sockets: Sockets,
-    shutdown_event: EventType,
+    sockets: Optional[Sockets],
+    shutdown_sock: socket.socket,
+    app: Optional[AppWrapper],
+    ssl_context: Optional[SSLContext],
     ctx: BaseContext,
 ) -> List[BaseProcess]:
     processes = []
     for _ in range(config.workers):
         process = ctx.Process(
             target=worker_func,
-            kwargs={"config": config, "shutdown_event": shutdown_event, "sockets": sockets},
+            kwargs={
+                "app": app,
+                "config": config,
+                "shutdown_sock": shutdown_sock,
+                "sockets": sockets,
+                "ssl_context": ssl_context,
+            },
         )
         process.daemon = True
         try:
@@ -100,6 +202,6 @@ def start_processes(
                 "Cannot pickle the config, see https://docs.python.org/3/library/pickle.html#pickle-picklable"  # noqa: E501
             ) from error
         processes.append(process)
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             time.sleep(0.1)
     return processes
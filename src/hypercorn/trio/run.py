@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from functools import partial
-from multiprocessing.synchronize import Event as EventType
+from socket import socket
+from ssl import SSLContext
 from typing import Awaitable, Callable, Optional
 
 import trio
@@ -13,13 +14,7 @@ from .udp_server import UDPServer
 from .worker_context import WorkerContext
 from ..config import Config, Sockets
 from ..typing import AppWrapper
-from ..utils import (
-    check_multiprocess_shutdown_event,
-    load_application,
-    raise_shutdown,
-    repr_socket_addr,
-    ShutdownError,
-)
+from ..utils import load_application, raise_shutdown, repr_socket_addr, ShutdownError
 
 
 async def worker_serve(
@@ -28,6 +23,7 @@ async def worker_serve(
     *,
     sockets: Optional[Sockets] = None,
     shutdown_trigger: Optional[Callable[..., Awaitable[None]]] = None,
+    ssl_context: Optional[SSLContext] = None,
     task_status: trio._core._run._TaskStatus = trio.TASK_STATUS_IGNORED,
 ) -> None:
     config.set_statsd_logger_class(StatsdLogger)
@@ -47,7 +43,8 @@ async def worker_serve(
                 for sock in sockets.insecure_sockets:
                     sock.listen(config.backlog)
 
-            ssl_context = config.create_ssl_context()
+            if ssl_context is None:
+                ssl_context = config.create_ssl_context()
             listeners = []
             binds = []
             for sock in sockets.secure_sockets:
@@ -100,17 +97,34 @@ async def worker_serve(
 
 
 def trio_worker(
-    config: Config, sockets: Optional[Sockets] = None, shutdown_event: Optional[EventType] = None
+    config: Config,
+    sockets: Optional[Sockets] = None,
+    shutdown_sock: Optional[socket] = None,
+    app: Optional[AppWrapper] = None,
+    ssl_context: Optional[SSLContext] = None,
 ) -> None:
     if sockets is not None:
         for sock in sockets.secure_sockets:
             sock.listen(config.backlog)
         for sock in sockets.insecure_sockets:
             sock.listen(config.backlog)
-    app = load_application(config.application_path, config.wsgi_max_body_size)
+    if app is None:
+        app = load_application(config.application_path, config.wsgi_max_body_size)
 
     shutdown_trigger = None
-    if shutdown_event is not None:
-        shutdown_trigger = partial(check_multiprocess_shutdown_event, shutdown_event, trio.sleep)
-
-    trio.run(partial(worker_serve, app, config, sockets=sockets, shutdown_trigger=shutdown_trigger))
+    if shutdown_sock is not None:
+        shutdown_trigger = partial(trio.lowlevel.wait_readable, shutdown_sock)
+
+    trio.run(
+        partial(
+            worker_serve,
+            app,
+            config,
+            sockets=sockets,
+            shutdown_trigger=shutdown_trigger,
+            ssl_context=ssl_context,
+        )
+    )
+
+    if shutdown_sock is not None:
+        shutdown_sock.close()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from multiprocessing.synchronize import Event as EventType
+from socket import socket
+from ssl import SSLContext
 from types import TracebackType
 from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, Type, Union
 
@@ -17,7 +18,10 @@ from .config import Config, Sockets
 
 H11SendableEvent = Union[h11.Data, h11.EndOfMessage, h11.InformationalResponse, h11.Response]
 
-WorkerFunc = Callable[[Config, Optional[Sockets], Optional[EventType]], None]
+WorkerFunc = Callable[
+    [Config, Optional[Sockets], Optional[socket], Optional["AppWrapper"], Optional[SSLContext]],
+    None,
+]
 
 
 class ASGIVersions(TypedDict, total=False):
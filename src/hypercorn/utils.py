@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import inspect
 import os
+import platform
+import select
+import signal
 import socket
 import sys
 import time
 from enum import Enum
-from importlib import import_module
-from multiprocessing.synchronize import Event as EventType
+from importlib import import_module, reload
 from pathlib import Path
+from types import ModuleType
 from typing import (
     Any,
     Awaitable,
@@ -18,6 +21,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     TYPE_CHECKING,
 )
@@ -34,6 +38,12 @@ except ImportError:
 if TYPE_CHECKING:
     from .protocol.events import Request
 
+IS_LINUX = platform.system() == "Linux"
+IS_WINDOWS = platform.system() == "Windows"
+SHUTDOWN_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGINT", "SIGTERM", "SIGBREAK") if hasattr(signal, name)
+)
+
 
 class ShutdownError(Exception):
     pass
@@ -95,6 +105,29 @@ def filter_pseudo_headers(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[byte
 
 
 def load_application(path: str, wsgi_max_body_size: int) -> AppWrapper:
+    module, app_name, mode = _import_application_module(path)
+    return _load_application_from_module(module, app_name, wsgi_max_body_size, mode)
+
+
+def reload_application(
+    path: str, wsgi_max_body_size: int, changed_paths: Set[Path]
+) -> Optional[AppWrapper]:
+    # Reloading a module in place does not update any references
+    # other modules hold to its contents, hence this is only done if
+    # the application's module, which nothing should import, is the
+    # only module to have changed. Otherwise None is returned.
+    module, app_name, mode = _import_application_module(path)
+    filename = getattr(module, "__file__", None)
+    if filename is None or Path(filename).suffix != ".py" or changed_paths != {Path(filename)}:
+        return None
+
+    module = reload(module)
+    return _load_application_from_module(module, app_name, wsgi_max_body_size, mode)
+
+
+def _import_application_module(
+    path: str,
+) -> Tuple[ModuleType, str, Optional[Literal["asgi", "wsgi"]]]:
     mode: Optional[Literal["asgi", "wsgi"]] = None
     if ":" not in path:
         module_name, app_name = path, "app"
@@ -106,7 +139,8 @@ def load_application(path: str, wsgi_max_body_size: int) -> AppWrapper:
         module_name, app_name = path.split(":", 1)
 
     module_path = Path(module_name).resolve()
-    sys.path.insert(0, str(module_path.parent))
+    if str(module_path.parent) not in sys.path:
+        sys.path.insert(0, str(module_path.parent))
     if module_path.is_file():
         import_name = module_path.with_suffix("").name
     else:
@@ -118,6 +152,15 @@ def load_application(path: str, wsgi_max_body_size: int) -> AppWrapper:
             raise NoAppError()
         else:
             raise
+    return module, app_name, mode
+
+
+def _load_application_from_module(
+    module: ModuleType,
+    app_name: str,
+    wsgi_max_body_size: int,
+    mode: Optional[Literal["asgi", "wsgi"]],
+) -> AppWrapper:
     try:
         app = eval(app_name, vars(module))
     except NameError:
@@ -137,7 +180,7 @@ def wrap_app(
         return WSGIWrapper(cast(WSGIFramework, app), wsgi_max_body_size)
 
 
-def wait_for_changes(shutdown_event: EventType) -> None:
+def wait_for_changes(wakeup_sock: socket.socket) -> Set[Path]:
     last_updates: Dict[Path, float] = {}
     for module in list(sys.modules.values()):
         filename = getattr(module, "__file__", None)
@@ -149,9 +192,13 @@ def wait_for_changes(shutdown_event: EventType) -> None:
         except (FileNotFoundError, NotADirectoryError):
             pass
 
-    while not shutdown_event.is_set():
-        time.sleep(1)
+    while True:
+        # Wait up to a second, or until the wakeup socket is written to
+        readable, _, _ = select.select([wakeup_sock], [], [], 1)
+        if readable:
+            return set()
 
+        changed_paths = set()
         for index, (path, last_mtime) in enumerate(last_updates.items()):
             if index % 10 == 0:
                 # Yield to the event loop
@@ -160,28 +207,22 @@ def wait_for_changes(shutdown_event: EventType) -> None:
             try:
                 mtime = path.stat().st_mtime
             except FileNotFoundError:
-                return
+                changed_paths.add(path)
             else:
                 if mtime > last_mtime:
-                    return
+                    changed_paths.add(path)
                 else:
                     last_updates[path] = mtime
 
+        if changed_paths:
+            return changed_paths
+
 
 async def raise_shutdown(shutdown_event: Callable[..., Awaitable[None]]) -> None:
     await shutdown_event()
     raise ShutdownError()
 
 
-async def check_multiprocess_shutdown_event(
-    shutdown_event: EventType, sleep: Callable[[float], Awaitable[Any]]
-) -> None:
-    while True:
-        if shutdown_event.is_set():
-            return
-        await sleep(0.1)
-
-
 def write_pid_file(pid_path: str) -> None:
     with open(pid_path, "w") as file_:
         file_.write(f"{os.getpid()}")
@@ -14,7 +14,12 @@ from hypercorn.asyncio.worker_context import EventWrapper
 from hypercorn.config import Config
 from hypercorn.events import Closed, RawData, Updated
 from hypercorn.protocol.events import Body, Data, EndBody, EndData, Request, Response, StreamClosed
-from hypercorn.protocol.h11 import H2CProtocolRequiredError, H2ProtocolAssumedError, H11Protocol
+from hypercorn.protocol.h11 import (
+    H2CProtocolRequiredError,
+    H2ProtocolAssumedError,
+    H11Protocol,
+    H11WSConnection,
+)
 from hypercorn.protocol.http_stream import HTTPStream
 from hypercorn.typing import Event as IOEvent
 
@@ -358,3 +363,22 @@ async def test_protocol_handle_data_post_close(protocol: H11Protocol) -> None:
     assert protocol.stream is None
     # Key is that this doesn't error
     await protocol.handle(RawData(data=b"abcdefghij"))
+
+
+def test_ws_connection_data() -> None:
+    h11_connection = h11.Connection(h11.SERVER)
+    h11_connection.receive_data(
+        b"GET / HTTP/1.1\r\nHost: hypercorn\r\nConnection: upgrade\r\nUpgrade: websocket\r\n\r\nabc"
+    )
+    assert isinstance(h11_connection.next_event(), h11.Request)
+    assert isinstance(h11_connection.next_event(), h11.EndOfMessage)
+    assert h11_connection.next_event() is h11.PAUSED
+    connection = H11WSConnection(h11_connection)
+    data = b"def"
+    connection.receive_data(data)
+    assert connection.next_event() == Data(stream_id=1, data=b"abcdef")
+    assert connection.next_event() is h11.NEED_DATA
+    connection.receive_data(data)
+    event = connection.next_event()
+    assert isinstance(event, Data)
+    assert event.data is data
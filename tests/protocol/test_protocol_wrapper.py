@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Tuple
+from unittest.mock import Mock
+
+import h11
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import hypercorn.protocol
+from hypercorn.config import Config
+from hypercorn.events import RawData
+from hypercorn.protocol import ProtocolWrapper
+from hypercorn.protocol.h2 import H2Protocol
+from hypercorn.protocol.h11 import H2CProtocolRequiredError, H2ProtocolAssumedError, H11Protocol
+
+try:
+    from unittest.mock import AsyncMock
+except ImportError:
+    # Python < 3.8
+    from mock import AsyncMock  # type: ignore
+
+
+@pytest.fixture(name="protocols")
+def _protocols(monkeypatch: MonkeyPatch) -> Tuple[AsyncMock, AsyncMock]:
+    h11_protocol = AsyncMock(spec=H11Protocol)
+    monkeypatch.setattr(hypercorn.protocol, "H11Protocol", Mock(return_value=h11_protocol))
+    h2_protocol = AsyncMock(spec=H2Protocol)
+    monkeypatch.setattr(hypercorn.protocol, "H2Protocol", Mock(return_value=h2_protocol))
+    return h11_protocol, h2_protocol
+
+
+def _wrapper(alpn_protocol: str) -> ProtocolWrapper:
+    return ProtocolWrapper(
+        AsyncMock(), Config(), Mock(), AsyncMock(), False, None, None, AsyncMock(), alpn_protocol
+    )
+
+
+@pytest.mark.asyncio
+async def test_alpn_h2_bypasses_wrapper(protocols: Tuple[AsyncMock, AsyncMock]) -> None:
+    _, h2_protocol = protocols
+    wrapper = _wrapper("h2")
+    assert wrapper.handle is h2_protocol.handle
+    await wrapper.handle(RawData(data=b"data"))
+    h2_protocol.handle.assert_awaited_once_with(RawData(data=b"data"))  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_h2_assumed_bypasses_wrapper(protocols: Tuple[AsyncMock, AsyncMock]) -> None:
+    h11_protocol, h2_protocol = protocols
+    h11_protocol.handle.side_effect = H2ProtocolAssumedError(b"PRI * HTTP/2.0")
+    wrapper = _wrapper("http/1.1")
+    await wrapper.handle(RawData(data=b"PRI * HTTP/2.0"))
+    assert wrapper.handle is h2_protocol.handle
+    h2_protocol.initiate.assert_awaited_once_with()
+    h2_protocol.handle.assert_awaited_once_with(RawData(data=b"PRI * HTTP/2.0"))  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_h2c_upgrade_bypasses_wrapper(protocols: Tuple[AsyncMock, AsyncMock]) -> None:
+    h11_protocol, h2_protocol = protocols
+    error = H2CProtocolRequiredError(
+        b"",
+        h11.Request(
+            method="GET", target="/", headers=[("Host", "hypercorn"), ("HTTP2-Settings", "")]
+        ),
+    )
+    h11_protocol.handle.side_effect = error
+    wrapper = _wrapper("http/1.1")
+    await wrapper.handle(RawData(data=b"data"))
+    assert wrapper.handle is h2_protocol.handle
+    h2_protocol.initiate.assert_awaited_once_with(error.headers, error.settings)
+    h2_protocol.handle.assert_not_awaited()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_http1_keeps_wrapper(protocols: Tuple[AsyncMock, AsyncMock]) -> None:
+    h11_protocol, h2_protocol = protocols
+    wrapper = _wrapper("http/1.1")
+    await wrapper.handle(RawData(data=b"first"))
+    h11_protocol.handle.assert_awaited_once_with(RawData(data=b"first"))
+    assert wrapper.handle.__func__ is ProtocolWrapper.handle  # type: ignore
+
+    # A later upgrade is still caught by the wrapper
+    h11_protocol.handle.side_effect = H2ProtocolAssumedError(b"PRI * HTTP/2.0")
+    await wrapper.handle(RawData(data=b"PRI * HTTP/2.0"))
+    assert wrapper.handle is h2_protocol.handle
+    h2_protocol.handle.assert_awaited_once_with(RawData(data=b"PRI * HTTP/2.0"))  # type: ignore
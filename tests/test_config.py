@@ -84,6 +84,11 @@ def test_create_sockets_ip(
     sockets = config.create_sockets()
     sock = sockets.insecure_sockets[0]
     mock_socket.assert_called_with(expected_family, socket.SOCK_STREAM)
+    sock.setsockopt.assert_any_call(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)  # type: ignore
+    if hasattr(socket, "TCP_NOTSENT_LOWAT"):
+        sock.setsockopt.assert_any_call(  # type: ignore
+            socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT, 16 * 1024
+        )
     sock.setsockopt.assert_called_with(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # type: ignore
     sock.bind.assert_called_with(expected_binding)  # type: ignore
     sock.setblocking.assert_called_with(False)  # type: ignore
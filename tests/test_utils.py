@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import sys
+from pathlib import Path
 from typing import Any, Callable, Iterable
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from hypercorn.typing import Scope
 from hypercorn.utils import (
     build_and_validate_headers,
     filter_pseudo_headers,
     is_asgi,
+    load_application,
+    reload_application,
     suppress_body,
 )
 
@@ -79,3 +84,37 @@ def test_filter_pseudo_headers_no_authority() -> None:
         [(b"host", b"quart"), (b":path", b"/"), (b"user-agent", b"something")]
     )
     assert result == [(b"host", b"quart"), (b"user-agent", b"something")]
+
+
+APP_MODULE = """
+async def app(scope, receive, send):
+    pass
+
+app.version = {version}
+"""
+
+
+@pytest.fixture(name="app_path")
+def _app_path(monkeypatch: MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setattr(sys, "modules", dict(sys.modules))
+    # Ensures a stale bytecode cache isn't used for the changed source
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    path = tmp_path / "reload_app.py"
+    path.write_text(APP_MODULE.format(version=1))
+    return path
+
+
+def test_reload_application(app_path: Path) -> None:
+    app = load_application(str(app_path), 100)
+    assert app.app.version == 1  # type: ignore
+    app_path.write_text(APP_MODULE.format(version=2))
+    path_length = len(sys.path)
+    app = reload_application(str(app_path), 100, {app_path})
+    assert app.app.version == 2  # type: ignore
+    assert len(sys.path) == path_length
+
+
+def test_reload_application_other_changes(app_path: Path) -> None:
+    load_application(str(app_path), 100)
+    assert reload_application(str(app_path), 100, {app_path, app_path.parent / "other.py"}) is None